@@ -9,6 +9,13 @@ function genInvoiceNumber(): string {
   return `${prefix}-${date}-${rand}`;
 }
 
+// Pi amounts have 7 decimal places — do money arithmetic on that integer grid
+const PI_UNITS = 10_000_000;
+
+function toUnits(amount: number): number {
+  return Math.round(Number(amount) * PI_UNITS);
+}
+
 // GET /api/invoices?storeId=xxx&customerPiUid=xxx&status=xxx
 export async function GET(req: Request) {
   try {
@@ -43,9 +50,11 @@ export async function POST(req: Request) {
       return NextResponse.json({ error: "storeId, customerPiUid, and items required" }, { status: 400 });
     }
 
-    const subtotal = items.reduce((sum: number, i: { unitPrice: number; quantity: number }) => sum + i.unitPrice * i.quantity, 0);
-    const fee = Number(escrowFee || 0);
-    const total = subtotal + fee;
+    const subtotalUnits = items.reduce((sum: number, i: { unitPrice: number; quantity: number }) => sum + toUnits(i.unitPrice) * i.quantity, 0);
+    const feeUnits = toUnits(escrowFee || 0);
+    const subtotal = subtotalUnits / PI_UNITS;
+    const fee = feeUnits / PI_UNITS;
+    const total = (subtotalUnits + feeUnits) / PI_UNITS;
 
     const invoice = await db.invoice.create({
       data: {
@@ -57,14 +66,17 @@ export async function POST(req: Request) {
         escrowFee: fee,
         total,
         notes: notes || "",
+        // Bulk insert — one statement for all items instead of one per row
         items: {
-          create: items.map((i: { productId?: string; productName: string; quantity: number; unitPrice: number }) => ({
-            productId: i.productId || null,
-            productName: i.productName,
-            quantity: i.quantity,
-            unitPrice: i.unitPrice,
-            totalPrice: i.unitPrice * i.quantity,
-          })),
+          createMany: {
+            data: items.map((i: { productId?: string; productName: string; quantity: number; unitPrice: number }) => ({
+              productId: i.productId || null,
+              productName: i.productName,
+              quantity: i.quantity,
+              unitPrice: i.unitPrice,
+              totalPrice: (toUnits(i.unitPrice) * i.quantity) / PI_UNITS,
+            })),
+          },
         },
       },
       include: { items: true, store: { select: { name: true, piUid: true } } },
@@ -116,8 +128,11 @@ export async function DELETE(req: Request) {
     if (!id) {
       return NextResponse.json({ error: "id required" }, { status: 400 });
     }
-    await db.invoiceItem.deleteMany({ where: { invoiceId: id } });
-    await db.invoice.delete({ where: { id } });
+    // One transaction — a single commit instead of one per statement
+    await db.$transaction([
+      db.invoiceItem.deleteMany({ where: { invoiceId: id } }),
+      db.invoice.delete({ where: { id } }),
+    ]);
     return NextResponse.json({ success: true });
   } catch {
     return NextResponse.json({ error: "Failed to delete invoice" }, { status: 500 });
@@ -63,8 +63,10 @@ export async function DELETE(req: Request) {
       return NextResponse.json({ error: "id required" }, { status: 400 });
     }
     // Remove product from invoice items first (set productId to null)
-    await db.invoiceItem.updateMany({ where: { productId: id }, data: { productId: null } });
-    await db.product.delete({ where: { id } });
+    await db.$transaction([
+      db.invoiceItem.updateMany({ where: { productId: id }, data: { productId: null } }),
+      db.product.delete({ where: { id } }),
+    ]);
     return NextResponse.json({ success: true });
   } catch {
     return NextResponse.json({ error: "Failed to delete product" }, { status: 500 });
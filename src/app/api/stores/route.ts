@@ -57,11 +57,14 @@ export async function DELETE(req: Request) {
     if (!id) {
       return NextResponse.json({ error: "id required" }, { status: 400 });
     }
-    // Delete invoice items first, then invoices, then products, then store
-    await db.invoiceItem.deleteMany({ where: { invoice: { storeId: id } } });
-    await db.invoice.deleteMany({ where: { storeId: id } });
-    await db.product.deleteMany({ where: { storeId: id } });
-    await db.store.delete({ where: { id } });
+    // Delete invoice items first, then invoices, then products, then store —
+    // batched into one transaction so the cascade commits once
+    await db.$transaction([
+      db.invoiceItem.deleteMany({ where: { invoice: { storeId: id } } }),
+      db.invoice.deleteMany({ where: { storeId: id } }),
+      db.product.deleteMany({ where: { storeId: id } }),
+      db.store.delete({ where: { id } }),
+    ]);
     return NextResponse.json({ success: true });
   } catch {
     return NextResponse.json({ error: "Failed to delete store" }, { status: 500 });
@@ -477,26 +477,29 @@ function DashboardView({
 }) {
   const totalInvoices = invoices.length;
   const totalProducts = products.length;
-  const inEscrow = invoices
-    .filter((i) => ["paid_escrow", "shipped", "delivered"].includes(i.status))
-    .reduce((s, i) => s + i.total, 0);
-  const completedPi = invoices
-    .filter((i) => i.status === "completed")
-    .reduce((s, i) => s + i.subtotal, 0);
-
   const now = new Date();
-  const thisMonth = invoices.filter((inv) => {
-    const d = new Date(inv.createdAt);
-    return d.getMonth() === now.getMonth() && d.getFullYear() === now.getFullYear();
-  });
-  const thisMonthTotal = thisMonth.reduce((s, i) => s + i.total, 0);
-  const lastMonth = invoices.filter((inv) => {
+  const cm = now.getMonth();
+  const cy = now.getFullYear();
+  const lm = cm === 0 ? 11 : cm - 1;
+  const ly = cm === 0 ? cy - 1 : cy;
+
+  // Single pass over invoices — no intermediate filtered arrays
+  let inEscrow = 0;
+  let completedPi = 0;
+  let thisMonthTotal = 0;
+  let lastMonthTotal = 0;
+  for (const inv of invoices) {
+    if (inv.status === "paid_escrow" || inv.status === "shipped" || inv.status === "delivered") {
+      inEscrow += inv.total;
+    } else if (inv.status === "completed") {
+      completedPi += inv.subtotal;
+    }
     const d = new Date(inv.createdAt);
-    const lm = now.getMonth() === 0 ? 11 : now.getMonth() - 1;
-    const ly = now.getMonth() === 0 ? now.getFullYear() - 1 : now.getFullYear();
-    return d.getMonth() === lm && d.getFullYear() === ly;
-  });
-  const lastMonthTotal = lastMonth.reduce((s, i) => s + i.total, 0);
+    const m = d.getMonth();
+    const y = d.getFullYear();
+    if (m === cm && y === cy) thisMonthTotal += inv.total;
+    else if (m === lm && y === ly) lastMonthTotal += inv.total;
+  }
   const revenueProgress =
     lastMonthTotal > 0
       ? Math.min((thisMonthTotal / lastMonthTotal) * 100, 100)